@@ -15,14 +15,47 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 from airline_analyzer import AirlineRouteAnalyzer
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler()
-    ]
-)
+logging.logThreads = False
+logging.logProcesses = False
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that only flushes on errors or when asked to"""
+    
+    def __init__(self, filename, buffer_size=65536):
+        self.buffer_size = buffer_size
+        super().__init__(filename)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        # Unlike StreamHandler.emit(), do not flush after every record.
+        try:
+            msg = self.format(record)
+            with self.lock:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(msg + self.terminator)
+                if record.levelno >= logging.ERROR:
+                    self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def setup_logging(timestamp):
+    # Log records are written to the file in buffer-sized chunks. ERROR
+    # records are written through immediately, and logging.shutdown()
+    # flushes the rest at exit; a hard kill can lose the buffered tail.
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            BufferedFileHandler(f'analysis_{timestamp}.log'),
+            logging.StreamHandler()
+        ]
+    )
 
 def setup_directories():
     directories = [
@@ -35,9 +68,10 @@ def setup_directories():
     
     for directory in directories:
         Path(directory).mkdir(parents=True, exist_ok=True)
-        logging.info(f"Ensured directory exists: {directory}")
+        logging.debug("Ensured directory exists: %s", directory)
 
 def main():
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     parser = argparse.ArgumentParser(description='Run Airline Route Profitability Analysis')
     parser.add_argument('--use-sample-data', action='store_true', 
                        help='Use generated sample data instead of real data')
@@ -48,6 +82,7 @@ def main():
     
     args = parser.parse_args()
     
+    setup_logging(timestamp)
     setup_directories()
     logging.info("Starting Airline Route Profitability Analysis")
     
@@ -65,7 +100,7 @@ def main():
         
         logging.info("Calculating route profitability...")
         profitability_df = analyzer.calculate_profitability()
-        logging.info(f"Analyzed {len(profitability_df)} routes")
+        logging.info("Analyzed %d routes", len(profitability_df))
         
         logging.info("Generating business insights...")
         insights = analyzer.generate_insights()
@@ -78,8 +113,8 @@ def main():
         logging.info("Generating recommendations...")
         recommendations = analyzer.generate_recommendations()
         
-        output_prefix = f"{args.output_dir}/airline_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        logging.info(f"Exporting results to {output_prefix}_*")
+        output_prefix = f"{args.output_dir}/airline_analysis_{timestamp}"
+        logging.info("Exporting results to %s_*", output_prefix)
         analyzer.export_results(output_prefix)
         
         print("\n" + "="*60)
@@ -108,7 +143,7 @@ def main():
         return 0
         
     except Exception as e:
-        logging.error(f"Analysis failed: {str(e)}")
+        logging.error("Analysis failed: %s", e)
         return 1
 
 if __name__ == "__main__":
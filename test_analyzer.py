@@ -4,6 +4,7 @@ Test suite for Airline Route Profitability Analysis
 """
 
 import unittest
+import copy
 import sys
 import os
 from pathlib import Path
@@ -15,9 +16,13 @@ sys.path.append(str(Path(__file__).parent.parent / 'src'))
 from airline_analyzer import AirlineRouteAnalyzer
 
 class TestAirlineAnalyzer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._analyzer = AirlineRouteAnalyzer()
+        cls._analyzer.generate_sample_data()
+    
     def setUp(self):
-        self.analyzer = AirlineRouteAnalyzer()
-        self.analyzer.generate_sample_data()
+        self.analyzer = copy.deepcopy(self._analyzer)
     
     def test_data_generation(self):
         self.assertIsNotNone(self.analyzer.routes_data)
@@ -39,9 +44,9 @@ class TestAirlineAnalyzer(unittest.TestCase):
         for col in required_columns:
             self.assertIn(col, routes_df.columns)
         
-        self.assertTrue(all(routes_df['distance_miles'] > 0))
-        self.assertTrue(all(routes_df['flight_time_hours'] > 0))
-        self.assertTrue(all(routes_df['daily_flights'] > 0))
+        self.assertTrue((routes_df['distance_miles'] > 0).all())
+        self.assertTrue((routes_df['flight_time_hours'] > 0).all())
+        self.assertTrue((routes_df['daily_flights'] > 0).all())
         
         self.assertEqual(len(routes_df['route_id']), len(routes_df['route_id'].unique()))
     
@@ -54,12 +59,12 @@ class TestAirlineAnalyzer(unittest.TestCase):
         for col in required_columns:
             self.assertIn(col, passenger_df.columns)
         
-        self.assertTrue(all(passenger_df['passengers'] >= 0))
-        self.assertTrue(all(passenger_df['load_factor'].between(0, 1)))
-        self.assertTrue(all(passenger_df['avg_ticket_price'] > 0))
-        self.assertTrue(all(passenger_df['revenue'] >= 0))
+        self.assertTrue((passenger_df['passengers'] >= 0).all())
+        self.assertTrue(passenger_df['load_factor'].between(0, 1).all())
+        self.assertTrue((passenger_df['avg_ticket_price'] > 0).all())
+        self.assertTrue((passenger_df['revenue'] >= 0).all())
         
-        self.assertTrue(all(passenger_df['month'].between(1, 12)))
+        self.assertTrue(passenger_df['month'].between(1, 12).all())
     
     def test_cost_data_integrity(self):
         cost_df = self.analyzer.cost_data
@@ -72,7 +77,7 @@ class TestAirlineAnalyzer(unittest.TestCase):
             self.assertIn(col, cost_df.columns)
         
         for col in required_columns[1:]:
-            self.assertTrue(all(cost_df[col] > 0))
+            self.assertTrue((cost_df[col] > 0).all())
         
         calculated_total = (cost_df['fuel_cost_per_flight'] + 
                           cost_df['crew_cost_per_flight'] + 
@@ -96,9 +101,9 @@ class TestAirlineAnalyzer(unittest.TestCase):
         for col in required_columns:
             self.assertIn(col, profitability_df.columns)
         
-        self.assertTrue(all(profitability_df['revenue'] >= 0))
-        self.assertTrue(all(profitability_df['passengers'] >= 0))
-        self.assertTrue(all(profitability_df['load_factor'].between(0, 1)))
+        self.assertTrue((profitability_df['revenue'] >= 0).all())
+        self.assertTrue((profitability_df['passengers'] >= 0).all())
+        self.assertTrue(profitability_df['load_factor'].between(0, 1).all())
         
         self.assertTrue(len(profitability_df) > 0)
     